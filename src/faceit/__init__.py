@@ -23,6 +23,7 @@ from .constants import (
     SkillLevel as SkillLevel,
 )
 from .exceptions import (
+    AiohttpNotFoundError as AiohttpNotFoundError,
     APIError as APIError,
     BadRequestError as BadRequestError,
     DecoupleNotFoundError as DecoupleNotFoundError,
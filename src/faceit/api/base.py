@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 import logging
-import warnings
 from abc import ABC
 from dataclasses import dataclass
+from functools import lru_cache
 from types import MappingProxyType
 from typing import (
     TYPE_CHECKING,
@@ -18,6 +18,7 @@ from typing import (
 
 from pydantic import ValidationError
 
+from faceit.api.pagination import store_pagination_limits
 from faceit.http import Endpoint
 from faceit.models import ItemPage
 from faceit.types import (
@@ -28,7 +29,7 @@ from faceit.types import (
     RawAPIPageResponse,
     RawAPIResponse,
 )
-from faceit.utils import find_user_stacklevel, representation
+from faceit.utils import representation, warn_user
 
 if TYPE_CHECKING:
     from collections.abc import Mapping
@@ -57,6 +58,19 @@ class MappedValidatorConfig(Generic[_T, ModelT]):
     default_validator: type[ModelT] | None = None
 
 
+# Every page of a mapped endpoint validates against the same parametrized
+# `ItemPage`, so it is built once per model rather than subscripted per page
+@lru_cache(maxsize=128)
+def _item_page_model(validator: type[ModelT], /) -> type[ItemPage[ModelT]]:
+    return cast(
+        "type[ItemPage[ModelT]]",
+        # Suppressing type checking warning because we're using a
+        # dynamic runtime subscript `ItemPage` is being subscripted
+        # with a variable (`validator`) which mypy cannot statically verify
+        ItemPage[validator],  # type: ignore[valid-type]
+    )
+
+
 # TODO: Refactor the base resource class if/when support for resources
 # other than Data is required, since the current implementation is
 # too Data-centric.
@@ -67,6 +81,13 @@ class BaseResource(ABC, Generic[ClientT]):
     if TYPE_CHECKING:
         PATH: ClassVar[Endpoint]
 
+    # TODO: Better message for missing validator
+    _NO_MODEL_WARN_MSG: ClassVar = (
+        "No model defined for this response. Validation and model "
+        "parsing are unavailable. Use the raw version for explicit, "
+        "unprocessed data."
+    )
+
     _PARAM_NAME_MAP: ClassVar[Mapping[str, str]] = MappingProxyType({
         "start": "from",
         "category": "type",
@@ -88,6 +109,7 @@ class BaseResource(ABC, Generic[ClientT]):
         resource_path: str | None = None,
         **kwargs: Any,
     ) -> None:
+        store_pagination_limits(cls)
         if hasattr(cls, "PATH"):
             return
         if resource_path is None:
@@ -126,16 +148,7 @@ class BaseResource(ABC, Generic[ClientT]):
             return response
 
         validator = config.validator_map.get(key, config.default_validator)
-        if validator is None:
-            page_validator = None
-        else:
-            page_validator = cast(
-                "type[ItemPage[ModelT]]",
-                # Suppressing type checking warning because we're using a
-                # dynamic runtime subscript `ItemPage` is being subscripted
-                # with a variable (`validator`) which mypy cannot statically verify
-                ItemPage[validator],  # type: ignore[valid-type]
-            )
+        page_validator = None if validator is None else _item_page_model(validator)
 
         return self._validate_response(
             response,
@@ -147,6 +160,12 @@ class BaseResource(ABC, Generic[ClientT]):
             ),
         )
 
+    def _process_unmodeled(self, response: _ResponseT, /) -> _ResponseT:
+        # Model mode only: raw callers return the payload without this call.
+        # Endpoints without a model hand it back as is, after a warning
+        warn_user(self.__class__._NO_MODEL_WARN_MSG)
+        return response
+
     def _validate_response(
         self,
         response: _ResponseT,
@@ -158,14 +177,8 @@ class BaseResource(ABC, Generic[ClientT]):
         if self._raw:
             return response
         if validator is None:
-            # TODO: Better message for missing validator
-            default_warn_msg = (
-                "No model defined for this response. Validation and model "
-                "parsing are unavailable. Use the raw version for explicit, "
-                "unprocessed data."
-            )
-            msg = default_warn_msg if warn_msg is None else warn_msg
-            warnings.warn(msg, stacklevel=find_user_stacklevel())
+            msg = self.__class__._NO_MODEL_WARN_MSG if warn_msg is None else warn_msg
+            warn_user(msg)
             return response
         try:
             return validator.model_validate(response)
@@ -173,10 +186,9 @@ class BaseResource(ABC, Generic[ClientT]):
             _logger.exception("Validation failed for %s", validator.__name__)
             if self._strict_validation:
                 raise
-            warnings.warn(
+            warn_user(
                 "Validation failed but strict mode disabled. Raw response returned.",
                 RuntimeWarning,
-                stacklevel=2,  # ???: What should be the stack level in this case
             )
             return response
 
@@ -1,20 +1,30 @@
 from __future__ import annotations
 
 from abc import ABC
-from typing import Annotated, Generic, TypeAlias, final, overload
+from functools import lru_cache
+from types import MappingProxyType
+from typing import (
+    TYPE_CHECKING,
+    Annotated,
+    Any,
+    Final,
+    Generic,
+    TypeAlias,
+    final,
+    overload,
+)
 
-from pydantic import AfterValidator, Field, validate_call
+from pydantic import AfterValidator, Field, TypeAdapter
 
-from faceit.api.base import BaseResource, ModelPlaceholder
+from faceit.api.base import BaseResource
 from faceit.api.pagination import (
     AsyncPageIterator,
     MaxItemsType,
     SyncPageIterator,
     pages,
+    pagination_limits,
 )
-from faceit.constants import GameID
 from faceit.http import AsyncClient, SyncClient
-from faceit.models import ItemPage
 from faceit.types import (
     APIResponseFormatT,
     ClientT,
@@ -30,6 +40,47 @@ _TeamIDValidated: TypeAlias = Annotated[
     _TeamID, AfterValidator(str)  # TODO: Validation function (maybe `FaceitID`?)
 ]
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from faceit.constants import GameID
+    from faceit.models import ItemPage
+
+_ALL_TOURNAMENTS_MAX_ITEMS: Final = pages(30)
+
+# `tournaments` is called without `validate_call`, so its defaults are plain
+# values and the page iterators read the bounds from `pagination_limits`
+_MAX_LIMIT: Final = 100
+
+# Shared by every `tournaments` signature and the adapters below
+_Offset: TypeAlias = Annotated[int, Field(ge=0)]
+_Limit: TypeAlias = Annotated[int, Field(ge=1, le=_MAX_LIMIT)]
+
+# Built once at import time, so each call only pays for a compiled schema
+# dispatch; failures raise `ValidationError`, as `validate_call` does elsewhere
+_TEAM_ID_ADAPTER: Final = TypeAdapter(_TeamIDValidated)
+_OFFSET_ADAPTER: Final = TypeAdapter(_Offset)
+_LIMIT_ADAPTER: Final = TypeAdapter(_Limit)
+
+
+def _check_team_id(team_id: Any, /) -> str:
+    return _TEAM_ID_ADAPTER.validate_python(team_id)
+
+
+@lru_cache(maxsize=256)
+def _cached_page_params(offset: int, limit: int, /) -> Mapping[str, Any]:
+    # Pagination walks repeat a handful of (offset, limit) pairs;
+    # the mapping is shared between calls, hence read-only
+    return MappingProxyType(BaseResource._build_params(offset=offset, limit=limit))
+
+
+def _page_params(offset: int, limit: int, /) -> Mapping[str, Any]:
+    # Validated before the lookup, so the cache only ever holds valid pairs
+    return _cached_page_params(
+        _OFFSET_ADAPTER.validate_python(offset),
+        _LIMIT_ADAPTER.validate_python(limit),
+    )
+
 
 class BaseTeams(
     BaseResource[ClientT],
@@ -39,6 +90,13 @@ class BaseTeams(
     __slots__ = ()
 
 
+@lru_cache(maxsize=1024)
+def _team_path(team_id: str, /, *segments: str) -> str:
+    # Unlike `Endpoint`, plain strings are hashable, so repeated requests
+    # also hit the client's endpoint cache instead of rebuilding the URL
+    return str(BaseTeams.PATH.add(team_id, *segments))
+
+
 @final
 class SyncTeams(BaseTeams[SyncClient], Generic[APIResponseFormatT]):
     __slots__ = ()
@@ -49,12 +107,11 @@ class SyncTeams(BaseTeams[SyncClient], Generic[APIResponseFormatT]):
     @overload
     def get(self: SyncTeams[Model], team_id: _TeamID) -> ModelNotImplemented: ...
 
-    @validate_call
-    def get(self, team_id: _TeamIDValidated) -> RawAPIItem | ModelNotImplemented:
-        return self._validate_response(
-            self._client.get(self.__class__.PATH / team_id, expect_item=True),
-            ModelPlaceholder,
+    def get(self, team_id: _TeamID) -> RawAPIItem | ModelNotImplemented:
+        response = self._client.get(
+            _team_path(_check_team_id(team_id)), expect_item=True
         )
+        return response if self._raw else self._process_unmodeled(response)
 
     __call__ = get
 
@@ -66,25 +123,20 @@ class SyncTeams(BaseTeams[SyncClient], Generic[APIResponseFormatT]):
         self: SyncTeams[Model], team_id: _TeamID, game: GameID
     ) -> ModelNotImplemented: ...
 
-    @validate_call
-    def stats(
-        self, team_id: _TeamIDValidated, game: GameID
-    ) -> RawAPIItem | ModelNotImplemented:
-        return self._validate_response(
-            self._client.get(
-                self.__class__.PATH / team_id / "stats" / game,
-                expect_item=True,
-            ),
-            ModelPlaceholder,
+    def stats(self, team_id: _TeamID, game: GameID) -> RawAPIItem | ModelNotImplemented:
+        response = self._client.get(
+            _team_path(_check_team_id(team_id), "stats", game),
+            expect_item=True,
         )
+        return response if self._raw else self._process_unmodeled(response)
 
     @overload
     def tournaments(
         self: SyncTeams[Raw],
         team_id: _TeamID,
         *,
-        offset: int = Field(0, ge=0),
-        limit: int = Field(20, ge=1, le=100),
+        offset: _Offset = 0,
+        limit: _Limit = 20,
     ) -> RawAPIPageResponse: ...
 
     @overload
@@ -92,41 +144,50 @@ class SyncTeams(BaseTeams[SyncClient], Generic[APIResponseFormatT]):
         self: SyncTeams[Model],
         team_id: _TeamID,
         *,
-        offset: int = Field(0, ge=0),
-        limit: int = Field(20, ge=1, le=100),
+        offset: _Offset = 0,
+        limit: _Limit = 20,
     ) -> ItemPage[ModelNotImplemented]: ...
 
-    @validate_call
+    @pagination_limits(_MAX_LIMIT)
     def tournaments(
         self,
-        team_id: _TeamIDValidated,
+        team_id: _TeamID,
         *,
-        offset: int = Field(0, ge=0),
-        limit: int = Field(20, ge=1, le=100),
+        offset: _Offset = 0,
+        limit: _Limit = 20,
     ) -> RawAPIPageResponse | ItemPage[ModelNotImplemented]:
-        return self._validate_response(
-            self._client.get(
-                self.__class__.PATH / team_id / "tournaments",
-                params=self.__class__._build_params(offset=offset, limit=limit),
-                expect_page=True,
-            ),
-            ModelPlaceholder,
+        response = self._client.get(
+            _team_path(_check_team_id(team_id), "tournaments"),
+            params=_page_params(offset, limit),
+            expect_page=True,
         )
+        return response if self._raw else self._process_unmodeled(response)
 
     @overload
     def all_tournaments(
-        self: SyncTeams[Raw], team_id: _TeamID, max_items: MaxItemsType = pages(30)
+        self: SyncTeams[Raw],
+        team_id: _TeamID,
+        max_items: MaxItemsType = _ALL_TOURNAMENTS_MAX_ITEMS,
+        prefetch: int = 1,
     ) -> list[RawAPIItem]: ...
 
     @overload
     def all_tournaments(
-        self: SyncTeams[Model], team_id: _TeamID, max_items: MaxItemsType = pages(30)
+        self: SyncTeams[Model],
+        team_id: _TeamID,
+        max_items: MaxItemsType = _ALL_TOURNAMENTS_MAX_ITEMS,
+        prefetch: int = 1,
     ) -> ItemPage[ModelNotImplemented]: ...
 
     def all_tournaments(
-        self, team_id: _TeamIDValidated, max_items: MaxItemsType = pages(30)
+        self,
+        team_id: _TeamID,
+        max_items: MaxItemsType = _ALL_TOURNAMENTS_MAX_ITEMS,
+        prefetch: int = 1,
     ) -> list[RawAPIItem] | ItemPage[ModelNotImplemented]:
-        iterator = SyncPageIterator(self.tournaments, team_id, max_items=max_items)
+        iterator = SyncPageIterator(
+            self.tournaments, team_id, max_items=max_items, prefetch=prefetch
+        )
         return iterator.collect()
 
 
@@ -140,12 +201,11 @@ class AsyncTeams(BaseTeams[AsyncClient], Generic[APIResponseFormatT]):
     @overload
     async def get(self: AsyncTeams[Model], team_id: _TeamID) -> ModelNotImplemented: ...
 
-    @validate_call
-    async def get(self, team_id: _TeamIDValidated) -> RawAPIItem | ModelNotImplemented:
-        return self._validate_response(
-            await self._client.get(self.__class__.PATH / team_id, expect_item=True),
-            ModelPlaceholder,
+    async def get(self, team_id: _TeamID) -> RawAPIItem | ModelNotImplemented:
+        response = await self._client.get(
+            _team_path(_check_team_id(team_id)), expect_item=True
         )
+        return response if self._raw else self._process_unmodeled(response)
 
     __call__ = get
 
@@ -159,25 +219,22 @@ class AsyncTeams(BaseTeams[AsyncClient], Generic[APIResponseFormatT]):
         self: AsyncTeams[Model], team_id: _TeamID, game: GameID
     ) -> ModelNotImplemented: ...
 
-    @validate_call
     async def stats(
-        self, team_id: _TeamIDValidated, game: GameID
+        self, team_id: _TeamID, game: GameID
     ) -> RawAPIItem | ModelNotImplemented:
-        return self._validate_response(
-            await self._client.get(
-                self.__class__.PATH / team_id / "stats" / game,
-                expect_item=True,
-            ),
-            ModelPlaceholder,
+        response = await self._client.get(
+            _team_path(_check_team_id(team_id), "stats", game),
+            expect_item=True,
         )
+        return response if self._raw else self._process_unmodeled(response)
 
     @overload
     async def tournaments(
         self: AsyncTeams[Raw],
         team_id: _TeamID,
         *,
-        offset: int = Field(0, ge=0),
-        limit: int = Field(20, ge=1, le=100),
+        offset: _Offset = 0,
+        limit: _Limit = 20,
     ) -> RawAPIPageResponse: ...
 
     @overload
@@ -185,39 +242,48 @@ class AsyncTeams(BaseTeams[AsyncClient], Generic[APIResponseFormatT]):
         self: AsyncTeams[Model],
         team_id: _TeamID,
         *,
-        offset: int = Field(0, ge=0),
-        limit: int = Field(20, ge=1, le=100),
+        offset: _Offset = 0,
+        limit: _Limit = 20,
     ) -> ItemPage[ModelNotImplemented]: ...
 
-    @validate_call
+    @pagination_limits(_MAX_LIMIT)
     async def tournaments(
         self,
-        team_id: _TeamIDValidated,
+        team_id: _TeamID,
         *,
-        offset: int = Field(0, ge=0),
-        limit: int = Field(20, ge=1, le=100),
+        offset: _Offset = 0,
+        limit: _Limit = 20,
     ) -> RawAPIPageResponse | ItemPage[ModelNotImplemented]:
-        return self._validate_response(
-            await self._client.get(
-                self.__class__.PATH / team_id / "tournaments",
-                params=self.__class__._build_params(offset=offset, limit=limit),
-                expect_page=True,
-            ),
-            ModelPlaceholder,
+        response = await self._client.get(
+            _team_path(_check_team_id(team_id), "tournaments"),
+            params=_page_params(offset, limit),
+            expect_page=True,
         )
+        return response if self._raw else self._process_unmodeled(response)
 
     @overload
     async def all_tournaments(
-        self: AsyncTeams[Raw], team_id: _TeamID, max_items: MaxItemsType = pages(30)
+        self: AsyncTeams[Raw],
+        team_id: _TeamID,
+        max_items: MaxItemsType = _ALL_TOURNAMENTS_MAX_ITEMS,
+        prefetch: int = 1,
     ) -> list[RawAPIItem]: ...
 
     @overload
     async def all_tournaments(
-        self: AsyncTeams[Model], team_id: _TeamID, max_items: MaxItemsType = pages(30)
+        self: AsyncTeams[Model],
+        team_id: _TeamID,
+        max_items: MaxItemsType = _ALL_TOURNAMENTS_MAX_ITEMS,
+        prefetch: int = 1,
     ) -> ItemPage[ModelNotImplemented]: ...
 
     async def all_tournaments(
-        self, team_id: _TeamIDValidated, max_items: MaxItemsType = pages(30)
+        self,
+        team_id: _TeamID,
+        max_items: MaxItemsType = _ALL_TOURNAMENTS_MAX_ITEMS,
+        prefetch: int = 1,
     ) -> list[RawAPIItem] | ItemPage[ModelNotImplemented]:
-        iterator = AsyncPageIterator(self.tournaments, team_id, max_items=max_items)
+        iterator = AsyncPageIterator(
+            self.tournaments, team_id, max_items=max_items, prefetch=prefetch
+        )
         return await iterator.collect()
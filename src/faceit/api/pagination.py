@@ -1,13 +1,15 @@
 from __future__ import annotations
 
+import asyncio
 import inspect
 import math
 import warnings
-from abc import ABC
-from collections.abc import AsyncIterator, Callable, Iterable, Iterator, Mapping
-from dataclasses import dataclass
-from itertools import chain
-from types import MappingProxyType
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import suppress
+from functools import lru_cache
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -42,26 +44,30 @@ from faceit.types import (
 from faceit.utils import (
     deduplicate_unhashable,
     deep_get,
+    defer_warnings,
     extends,
     find_user_stacklevel,
     representation,
     validate_positive_int,
+    warn_user,
 )
 
 CollectReturnFormat: TypeAlias = Literal["first", "raw", "model"]
 MaxItemsType: TypeAlias = Literal["safe"] | int
 _PageType: TypeAlias = RawAPIPageResponse | ItemPage[Any]
-_PageList: TypeAlias = list[_PageType]
 _PageT = TypeVar("_PageT", bound=_PageType)
+_CallableT = TypeVar("_CallableT", bound=Callable[..., Any])
+# A page fetched ahead, with the warnings raised while fetching it held back
+# for the consumer: the fetch runs on a worker thread or task, with no user
+# frame on its stack to point at
+_FetchedPage: TypeAlias = tuple[_T, list[tuple[str, type[Warning]]]]
 
 
 if TYPE_CHECKING:
     from typing_extensions import Self
 
-    _PageFactoryMap: TypeAlias = Mapping[
-        CollectReturnFormat,
-        Callable[[_PageList], type[RawAPIPageResponse | ItemPage[Any]]],
-    ]
+    from faceit.api.base import BaseResource
+
     _OptionalTimestampPaginationConfig: TypeAlias = (
         "TimestampPaginationConfig | Literal[False]"
     )
@@ -95,33 +101,60 @@ class pages(int):
         raise ValueError(msg)
 
 
-@dataclass(eq=False, frozen=True)
-class _MethodCall(Generic[PaginationMethodT]):
-    call: PaginationMethodT
-    args: tuple[Any, ...]
-    kwargs: dict[str, Any]
+_UNIX_METHOD_REQUIRED_KEY_NAMES: Final = tuple(
+    TimestampPaginationConfig.__annotations__
+)
+_UNIX_METHOD_REQUIRED_KEYS: Final = frozenset(_UNIX_METHOD_REQUIRED_KEY_NAMES)
+_PAGINATION_ARGS: Final = PaginationMaxParams._fields
+_PAGINATION_ARGS_SET: Final = frozenset(_PAGINATION_ARGS)
+_UNIX_PAGINATION_PARAMS: Final = frozenset(PaginationTimeRange.model_fields)
+_PAGINATION_LIMITS_ATTR: Final = "__pagination_limits__"
+
 
+def _pop_managed_params(kwargs: dict[str, Any], managed: frozenset[str], /) -> bool:
+    # Drops every managed parameter (not just the first one found)
+    # and reports whether the user supplied any of them
+    if managed.isdisjoint(kwargs):
+        # Common case: nothing to drop, so skip building the intersection
+        return False
+    supplied = managed & kwargs.keys()
+    for param in supplied:
+        del kwargs[param]
+    return bool(supplied)
 
-class _MaxItemsInfo(NamedTuple):
-    max_items: MaxItemsType
-    last_page_remainder: int
-    is_partial_last_page: bool
 
-    @classmethod
-    def from_max_pages(cls, max_pages: MaxItemsType, /) -> Self:
-        return cls(max_pages, 0, is_partial_last_page=False)
+def _unbound(method: Callable[..., Any], /) -> Callable[..., Any]:
+    # Bound methods are recreated on every attribute access,
+    # so caches below are keyed on the underlying function
+    return cast("Callable[..., Any]", getattr(method, "__func__", method))
 
 
-_UNIX_METHOD_REQUIRED_KEYS: Final = frozenset(TimestampPaginationConfig.__annotations__)
-_PAGINATION_ARGS: Final = PaginationMaxParams._fields
-_UNIX_PAGINATION_PARAMS: Final = PaginationTimeRange.model_fields.keys()
+@lru_cache(maxsize=256)
+def _param_names(func: Callable[..., Any], /) -> frozenset[str]:
+    # Existence checks only need the names, which the code object already has;
+    # `inspect.signature` is kept for callables without one
+    code = getattr(inspect.unwrap(func), "__code__", None)
+    if code is None:
+        return frozenset(inspect.signature(func).parameters)
+    return frozenset(code.co_varnames[: code.co_argcount + code.co_kwonlyargcount])
 
 
 def _has_unix_pagination_params(method: BaseResourceMethodProtocol[Any], /) -> bool:
-    return all(
-        param in inspect.signature(method).parameters
-        for param in _UNIX_PAGINATION_PARAMS
-    )
+    return _UNIX_PAGINATION_PARAMS.issubset(_param_names(_unbound(method)))
+
+
+def _page_size(page: _PageType | None, /) -> int | None:
+    # Item count of a fetched page, or `None` when the page ends iteration
+    # (no response, or a model page without items); sized once per page
+    if isinstance(page, dict):
+        return len(page[RAW_RESPONSE_ITEMS_KEY]) if page else None
+    return (len(page) or None) if page is not None else None
+
+
+def _reemit_warnings(deferred: list[tuple[str, type[Warning]]], /) -> None:
+    # On the consuming side, so the warnings point at the code iterating pages
+    for message, category in deferred:
+        warn_user(message, category)
 
 
 def _get_le(param: inspect.Parameter, /) -> Le | None:
@@ -129,6 +162,21 @@ def _get_le(param: inspect.Parameter, /) -> Le | None:
     return next(generator, None)
 
 
+@lru_cache(maxsize=128)
+def _last_page_limit(offset: int, remainder: int, limit: int, /) -> int:
+    # The smallest limit covering the remainder that divides the offset. Scanning
+    # at most `limit` candidates is cheaper than enumerating the offset's divisors,
+    # and the same few (offset, remainder) pairs recur across iterators.
+    return next(
+        (
+            possible_limit
+            for possible_limit in range(remainder, limit + 1)
+            if offset % possible_limit == 0
+        ),
+        remainder,
+    )
+
+
 def _extract_pagination_limits(
     limit_param: inspect.Parameter, offset_param: inspect.Parameter, method_name: str, /
 ) -> PaginationMaxParams:
@@ -156,19 +204,72 @@ def _extract_pagination_limits(
     return PaginationMaxParams(validate_positive_int(limit_constraint.le), offset)
 
 
-def check_pagination_support(
-    func: Callable[..., Any], /
-) -> PaginationMaxParams | Literal[False]:
+@lru_cache(maxsize=1)
+def _base_resource_cls() -> type[BaseResource[Any]]:
     # Imported here to avoid circular dependency: `base` imports iterators and config
     # to integrate them into `BaseResource` for convenient use in subclasses.
+    # Resolved once, rather than running the import statement on every check.
     from faceit.api.base import BaseResource  # noqa: PLC0415
 
-    if not hasattr(func, "__self__") or not issubclass(
-        func.__self__.__class__,  # pyright: ignore[reportFunctionMemberAccess]
-        BaseResource,
-    ):
+    return BaseResource
+
+
+def check_pagination_support(
+    func: Callable[..., Any], /
+) -> PaginationMaxParams | Literal[False]:
+    if not isinstance(getattr(func, "__self__", None), _base_resource_cls()):
         return False
 
+    return _stored_pagination_limits(_unbound(func))
+
+
+def _stored_pagination_limits(
+    func: Callable[..., Any], /
+) -> PaginationMaxParams | Literal[False]:
+    # Stored on the function itself, so repeated lookups (one per iterator)
+    # are a plain attribute load instead of hashing into a cache
+    limits = getattr(func, _PAGINATION_LIMITS_ATTR, None)
+    if limits is None:
+        limits = _resolve_pagination_limits(func)
+        with suppress(AttributeError, TypeError):
+            setattr(func, _PAGINATION_LIMITS_ATTR, limits)
+    return cast("PaginationMaxParams | Literal[False]", limits)
+
+
+def store_pagination_limits(cls: type, /) -> None:
+    """
+    Resolves pagination limits for the methods defined on a resource class
+    as it is created, so iterators over them never inspect signatures.
+    Methods with invalid pagination parameters are left unresolved and
+    report the error when an iterator is first built over them.
+    """
+    for attr in vars(cls).values():
+        if inspect.isfunction(attr):
+            with suppress(TypeError, ValueError):
+                _stored_pagination_limits(attr)
+
+
+def pagination_limits(
+    limit: int, offset: int | None = None, /
+) -> Callable[[_CallableT], _CallableT]:
+    """
+    Declares the pagination bounds of a method whose ``limit``/``offset``
+    defaults are plain values rather than ``Field(...)`` constraints.
+    """
+    limits = PaginationMaxParams(validate_positive_int(limit), offset)
+
+    def decorator(func: _CallableT, /) -> _CallableT:
+        setattr(func, _PAGINATION_LIMITS_ATTR, limits)
+        return func
+
+    return decorator
+
+
+def _resolve_pagination_limits(
+    func: Callable[..., Any], /
+) -> PaginationMaxParams | Literal[False]:
+    if not _PAGINATION_ARGS_SET.issubset(_param_names(func)):
+        return False
     limit_param, offset_param = (
         inspect.signature(func).parameters.get(arg) for arg in _PAGINATION_ARGS
     )
@@ -181,30 +282,69 @@ def check_pagination_support(
     )
 
 
+@final
+class _PageCollector(Generic[_T]):
+    # Folds pages into a single item list as they arrive,
+    # so collecting never holds the pages and the result at once
+    __slots__ = ("_empty_is_raw", "_is_raw", "_items")
+
+    def __init__(self, return_format: CollectReturnFormat, /) -> None:
+        # "first" is resolved from whichever page comes first
+        self._is_raw: bool | None = (
+            None if return_format == "first" else (return_format == "raw")
+        )
+        self._items: list[Any] = []
+        self._empty_is_raw = True
+
+    def add(self, page: RawAPIPageResponse | ItemPage[_T], /) -> None:
+        if self._is_raw is None:
+            self._is_raw = isinstance(page, dict)
+        if self._is_raw and isinstance(page, dict):
+            self._items.extend(page[RAW_RESPONSE_ITEMS_KEY])
+        elif not self._is_raw and isinstance(page, ItemPage):
+            self._items.extend(page.items)
+
+    @classmethod
+    def for_iterator(
+        cls, iterator: object, return_format: CollectReturnFormat, /
+    ) -> Self:
+        collector = cls(return_format)
+        # A page iterator knows its resource's format before any page arrives,
+        # so an empty "first" collect still returns the matching type
+        if isinstance(iterator, BasePageIterator):
+            collector._empty_is_raw = iterator._yields_raw
+        return collector
+
+    def result(self, *, deduplicate: bool) -> list[RawAPIItem] | ItemPage[_T]:
+        items = deduplicate_unhashable(self._items) if deduplicate else self._items
+        # With no pages at all, "first" falls back to the iterator's format
+        is_raw = self._empty_is_raw if self._is_raw is None else self._is_raw
+        return items if is_raw else ItemPage.with_items(items)
+
+
 _ITERATOR_SLOTS: Final = (
+    "_args",
+    "_call",
     "_exhausted",
-    "_max_items_info",
+    "_kwargs",
+    "_last_page_remainder",
+    "_max_items",
     "_max_pages",
-    "_method",
     "_offset",
     "_page_index",
     "_pagination_limits",
+    "_prefetch",
 )
 
 
-@representation(*_ITERATOR_SLOTS)
+# Only cheap scalar state: the call's args/kwargs can carry large payloads
+@representation("_offset", "_page_index", "_max_pages", "_max_items", "_exhausted")
 class BasePageIterator(ABC, Generic[PaginationMethodT, _PageT]):
-    __slots__ = _ITERATOR_SLOTS
+    __slots__ = (*_ITERATOR_SLOTS, "_pending")
 
     if TYPE_CHECKING:
         _STOP_ITERATION_EXC: ClassVar[type[Exception]]
 
-    _COLLECT_RETURN_FORMATS: ClassVar[_PageFactoryMap] = MappingProxyType({
-        "first": lambda c: type(c[0]) if c else RawAPIPageResponse,
-        "raw": lambda _: RawAPIPageResponse,
-        "model": lambda _: ItemPage,
-    })
-
     SAFE_MAX_PAGES: ClassVar = 100
     DEFAULT_MAX_ITEMS: ClassVar = 2000
     """
@@ -218,6 +358,7 @@ class BasePageIterator(ABC, Generic[PaginationMethodT, _PageT]):
         /,
         *args: Any,
         max_items: MaxItemsType = DEFAULT_MAX_ITEMS,
+        prefetch: int = 1,
         **kwargs: Any,
     ) -> None:
         pagination_limits = check_pagination_support(method)
@@ -227,28 +368,28 @@ class BasePageIterator(ABC, Generic[PaginationMethodT, _PageT]):
                 "Ensure it's a BaseResource method with offset and limit parameters."
             )
             raise ValueError(msg)
-        self._method = _MethodCall[PaginationMethodT](
-            method, args, self.__class__._remove_pagination_args(**kwargs)
-        )
+        self._call = method
+        self._args = args
+        self._kwargs = self.__class__._remove_pagination_args(**kwargs)
         self._pagination_limits = pagination_limits
+        self._prefetch = validate_positive_int(prefetch, param_name="prefetch")
+        self._pending: deque[Any] = deque()
         self._max_pages_setter(max_items)
         self._init_iteration()
 
     def _init_iteration(self) -> None:
+        self._discard_pending()
         self._exhausted = False
         self._offset = 0
         self._page_index = 0
 
     @property
     def max_items(self) -> int:
-        return (
-            self._max_items_info.max_items * self._pagination_limits.limit
-            if isinstance(self._max_items_info.max_items, pages)
-            else int(self._max_items_info.max_items)
-        )
+        return self._max_items
 
     @max_items.setter
     def max_items(self, value: MaxItemsType, /) -> None:
+        self._discard_pending()
         self._max_pages_setter(value)
 
     @property
@@ -273,50 +414,78 @@ class BasePageIterator(ABC, Generic[PaginationMethodT, _PageT]):
                 f"({self._pagination_limits.limit}): {value}."
             )
             raise ValueError(msg)
+        self._discard_pending()
         self._offset = value
 
     @property
     def current_page_index(self) -> int:
         return self._page_index
 
+    @property
+    def _yields_raw(self) -> bool:
+        # `check_pagination_support` guarantees a bound `BaseResource` method
+        return bool(self._call.__self__._raw)  # type: ignore[attr-defined]
+
     @property
     def supports_unix_params(self) -> bool:
-        return _has_unix_pagination_params(self._method.call)
+        return _has_unix_pagination_params(self._call)
 
     @property
     def _effective_limit(self) -> int:
+        return self._limit_for(self._page_index, self._offset)
+
+    def _limit_for(self, page_index: int, offset: int, /) -> int:
         """
         Returns an effective limit for the last page to ensure the offset
         is a multiple of the limit, as required by the API
         ("400 Bad pagination request: 'offset' must be a multiple of 'limit'").
         """
-        if not (
-            self._max_items_info.is_partial_last_page
-            and self._page_index == self._max_pages - 1
-        ):
+        if not self._last_page_remainder or page_index != self._max_pages - 1:
             return self._pagination_limits.limit
-        return next(
-            (
-                possible_limit
-                for possible_limit in range(
-                    self._max_items_info.last_page_remainder,
-                    self._pagination_limits.limit + 1,
-                )
-                if self._offset % possible_limit == 0
-            ),
-            self._max_items_info.last_page_remainder,
+        return _last_page_limit(
+            offset, self._last_page_remainder, self._pagination_limits.limit
         )
 
+    def _fill_window(self) -> None:
+        # Requests the upcoming pages ahead of time, up to `prefetch` in flight.
+        # Only pages that sequential iteration would certainly reach are requested:
+        # the page count and offset cap are known up front, a short page is not.
+        # The first page goes out alone, so single-page results cost one request.
+        pending, current_index = self._pending, self._page_index
+        window = 1 if current_index == 0 else self._prefetch
+        limit, offset_cap = self._pagination_limits
+        page_index = current_index + len(pending)
+        offset = self._offset + len(pending) * limit
+        while len(pending) < window:
+            if page_index >= self._max_pages or (
+                page_index != current_index
+                and offset_cap is not None
+                and offset - limit >= offset_cap
+            ):
+                return
+            pending.append(self._submit(self._limit_for(page_index, offset), offset))
+            page_index += 1
+            offset += limit
+
+    @abstractmethod
+    def _submit(self, limit: int, offset: int, /) -> Any:
+        """Starts fetching the page at `offset` without waiting for it."""
+
+    @abstractmethod
+    def _discard_pending(self) -> None:
+        """Drops the pages requested ahead of the current one."""
+
     def reset(self) -> None:
         self._init_iteration()
 
     def with_updated_args(self, *args: Any, **kwargs: Any) -> Self:
-        return self.__class__(self._method.call, *args, **kwargs)
+        return self.__class__(self._call, *args, **kwargs)
 
     def _max_pages_setter(self, max_items: MaxItemsType, /) -> None:
         def set_max_pages(max_pages: int, /) -> None:
             self._max_pages = max_pages
-            self._max_items_info = _MaxItemsInfo.from_max_pages(max_pages)
+            self._max_items = max_pages * self._pagination_limits.limit
+            self._last_page_remainder = 0
 
         def warn_if_exceeds_safe(max_pages: int, /) -> int:
             if max_pages > self.__class__.SAFE_MAX_PAGES:
@@ -337,49 +506,37 @@ class BasePageIterator(ABC, Generic[PaginationMethodT, _PageT]):
             return
 
         validated_max_items = validate_positive_int(max_items, param_name="max_items")
-        last_page_remainder = validated_max_items % self._pagination_limits.limit
-        self._max_items_info = _MaxItemsInfo(
-            validated_max_items, last_page_remainder, last_page_remainder != 0
-        )
+        self._max_items = validated_max_items
+        self._last_page_remainder = validated_max_items % self._pagination_limits.limit
         self._max_pages = warn_if_exceeds_safe(
             math.ceil(validated_max_items / self._pagination_limits.limit)
         )
 
-    def _handle_iteration_state(self, page: _PageT | None, /) -> _PageT:
-        if page is None:
+    def _handle_iteration_state(self, page: _PageT, /) -> _PageT:
+        if (size := _page_size(page)) is None:
             self._exhausted = True
+            self._discard_pending()
             raise self.__class__._STOP_ITERATION_EXC
 
-        self._page_index += 1
-
-        is_page_smaller_than_limit = (
-            len(page[RAW_RESPONSE_ITEMS_KEY] if isinstance(page, dict) else page)
-            < self._pagination_limits.limit
-        )
-
-        is_offset_exceeded = (
-            self._pagination_limits.offset is not None
-            and self._offset >= self._pagination_limits.offset
-        )
-
-        is_max_items_reached = self._page_index >= self._max_pages
-        if is_max_items_reached and self._max_items_info.is_partial_last_page:
-            # Considering post-filtering extra items on the last page when the limit
-            # is increased due to offset/limit constraints (see `_effective_limit`).
-            # For now, we leave this to the user and warn that the response may
-            # contain more items than requested in such cases.
-            pass
-
+        limit, offset_cap = self._pagination_limits
+        offset, page_index = self._offset, self._page_index + 1
+        self._page_index = page_index
+        self._offset = offset + limit
+        # NOTE: When the last page is partial, its limit may have been increased due
+        # to offset/limit constraints (see `_effective_limit`), so it can contain
+        # more items than requested. For now, we leave post-filtering to the user.
         self._exhausted = (
-            is_page_smaller_than_limit or is_offset_exceeded or is_max_items_reached
+            size < limit
+            or (offset_cap is not None and offset >= offset_cap)
+            or page_index >= self._max_pages
         )
-
-        self._offset += self._pagination_limits.limit
+        if self._exhausted:
+            self._discard_pending()
         return page
 
     @staticmethod
     def _remove_pagination_args(**kwargs: _T) -> dict[str, _T]:
-        if any([kwargs.pop(arg, None) for arg in _PAGINATION_ARGS]):  # noqa: C419
+        if _pop_managed_params(kwargs, _PAGINATION_ARGS_SET):
             warnings.warn(
                 f"Pagination parameters {_PAGINATION_ARGS} should not be "
                 "provided by users. These parameters are managed internally "
@@ -392,20 +549,19 @@ class BasePageIterator(ABC, Generic[PaginationMethodT, _PageT]):
     def _validate_unix_config(
         unix_config: _OptionalTimestampPaginationConfig, /
     ) -> None:
-        if unix_config is not False and not isinstance(unix_config, dict):
+        if unix_config is False:
+            return
+        if not isinstance(unix_config, dict):
             msg = (  # type: ignore[unreachable]
                 "Invalid unix pagination configuration: expected TimestampPaginationConfig "
                 f"dictionary or False, got {type(unix_config).__name__}. "
                 "See pagination.TimestampPaginationConfig for the required format."
             )
-            raise ValueError(msg)
-        if (
-            isinstance(unix_config, dict)
-            and _UNIX_METHOD_REQUIRED_KEYS - unix_config.keys()
-        ):
+            raise ValueError(msg)  # noqa: TRY004
+        if not _UNIX_METHOD_REQUIRED_KEYS.issubset(unix_config):
             msg = (
                 "Invalid unix pagination configuration: "
-                f"missing required keys {tuple(_UNIX_METHOD_REQUIRED_KEYS)}. "
+                f"missing required keys {_UNIX_METHOD_REQUIRED_KEY_NAMES}. "
                 "See pagination.TimestampPaginationConfig for the required format."
             )
             raise ValueError(msg)
@@ -444,75 +600,91 @@ class BasePageIterator(ABC, Generic[PaginationMethodT, _PageT]):
         ):
             msg = f"Key and attribute parameters must be non-empty strings: {cfg['key']}, {cfg['attr']}."
             raise ValueError(msg)
-        if any(kwargs.pop(arg, None) for arg in _UNIX_PAGINATION_PARAMS):
+        if _pop_managed_params(kwargs, _UNIX_PAGINATION_PARAMS):
             warnings.warn(
                 "The parameters 'start' and 'to' will be managed automatically with Unix "
                 "timestamp pagination. Your provided values will be ignored.",
                 stacklevel=find_user_stacklevel(),
             )
 
-    @classmethod
-    def _process_collected_pages(
-        cls,
-        collection: list[RawAPIPageResponse | ItemPage[_T]],
-        return_format: CollectReturnFormat,
-        deduplicate: bool,  # noqa: FBT001
-    ) -> list[RawAPIItem] | ItemPage[_T]:
-        if cls._COLLECT_RETURN_FORMATS[return_format](collection) is dict:
-            raw = chain.from_iterable(
-                p[RAW_RESPONSE_ITEMS_KEY] for p in collection if isinstance(p, dict)
-            )
-            return cls._deduplicate_collection(raw) if deduplicate else list(raw)
-        model = ItemPage.merge(p for p in collection if isinstance(p, ItemPage))
-        return cls._deduplicate_collection(model) if deduplicate else model
-
-    @classmethod
-    def _deduplicate_collection(
-        cls, collection: Iterable[RawAPIItem] | ItemPage[_T], /
-    ) -> list[RawAPIItem] | ItemPage[_T]:
-        if not isinstance(collection, ItemPage):
-            return deduplicate_unhashable(collection)
-        return collection.with_items(deduplicate_unhashable(collection))  # pyright: ignore[reportArgumentType, reportReturnType]
-
-    @classmethod
-    def _create_unix_timestamp_iterator(
-        cls,
-        method: PaginationMethodT,
-        /,
-        *args: Any,
-        timestamp: int | None,
-        **kwargs: Any,
-    ) -> Self:
-        return cls(
-            method,
-            *args,
-            **(kwargs | ({} if timestamp is None else {"to": timestamp + 1})),
-        )
+    def _rewind_unix_window(self, timestamp: int, max_items: int, /) -> None:
+        # Unix pagination moves to the next time window by rewinding the same
+        # iterator: the method, its arguments and pagination limits are unchanged
+        self._kwargs["to"] = timestamp + 1
+        self._max_pages_setter(max_items)
+        self._init_iteration()
 
 
 class _BaseSyncPageIterator(
     BasePageIterator[SyncResourceMethodProtocol[_PageT], _PageT],
     Iterator[_PageT],
 ):
-    __slots__ = ()
+    __slots__ = ("_executor",)
 
     _STOP_ITERATION_EXC = StopIteration
 
+    if TYPE_CHECKING:
+        _pending: deque[Future[_FetchedPage[_PageT]]]
+
+    def __init__(
+        self,
+        method: SyncResourceMethodProtocol[_PageT],
+        /,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        self._executor: ThreadPoolExecutor | None = None
+        super().__init__(method, *args, **kwargs)
+
     def __iter__(self) -> Self:
         return self
 
     def __next__(self) -> _PageT:
         if self._exhausted:
             raise self.__class__._STOP_ITERATION_EXC
-        return self._handle_iteration_state(
-            self._method.call(
-                *self._method.args,
-                **self._method.kwargs,
+        if self._prefetch == 1:
+            page = self._call(
+                *self._args,
+                **self._kwargs,
                 limit=self._effective_limit,
                 offset=self._offset,
             )
-            or None
-        )
+        else:
+            self._fill_window()
+            try:
+                page, deferred = self._pending.popleft().result()
+            except BaseException:
+                self._discard_pending()
+                raise
+            _reemit_warnings(deferred)
+        return self._handle_iteration_state(page)
+
+    def close(self) -> None:
+        """Stops iteration early, cancelling pages requested ahead."""
+        self._exhausted = True
+        self._discard_pending()
+
+    def _submit(self, limit: int, offset: int, /) -> Future[_FetchedPage[_PageT]]:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                self._prefetch, thread_name_prefix=self.__class__.__name__
+            )
+        return self._executor.submit(self._fetch_ahead, limit, offset)
+
+    def _fetch_ahead(self, limit: int, offset: int, /) -> _FetchedPage[_PageT]:
+        with defer_warnings() as deferred:
+            page = self._call(*self._args, **self._kwargs, limit=limit, offset=offset)
+        return page, deferred
+
+    def _discard_pending(self) -> None:
+        while self._pending:
+            self._pending.pop().cancel()
+        if self._executor is not None:
+            # Idle workers exit as soon as the window closes and the pool is
+            # recreated on demand by `_submit`. Not waiting keeps a short last
+            # page or an interrupt from blocking on in-flight speculative fetches
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
 
 
 class _BaseAsyncPageIterator(
@@ -523,21 +695,59 @@ class _BaseAsyncPageIterator(
 
     _STOP_ITERATION_EXC = StopAsyncIteration
 
+    if TYPE_CHECKING:
+        _pending: deque[asyncio.Future[_FetchedPage[_PageT]]]
+
     def __aiter__(self) -> Self:
         return self
 
     async def __anext__(self) -> _PageT:
         if self._exhausted:
             raise self.__class__._STOP_ITERATION_EXC
-        return self._handle_iteration_state(
-            await self._method.call(
-                *self._method.args,
-                **self._method.kwargs,
+        if self._prefetch == 1:
+            page = await self._call(
+                *self._args,
+                **self._kwargs,
                 limit=self._effective_limit,
                 offset=self._offset,
             )
-            or None
-        )
+        else:
+            self._fill_window()
+            try:
+                page, deferred = await self._pending.popleft()
+            except BaseException:
+                self._discard_pending()
+                raise
+            _reemit_warnings(deferred)
+        return self._handle_iteration_state(page)
+
+    async def aclose(self) -> None:
+        """Stops iteration early, cancelling pages requested ahead."""
+        self._exhausted = True
+        tasks = tuple(self._pending)
+        self._discard_pending()
+        # Let the cancelled fetches unwind before the caller moves on
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _submit(
+        self, limit: int, offset: int, /
+    ) -> asyncio.Future[_FetchedPage[_PageT]]:
+        return asyncio.ensure_future(self._fetch_ahead(limit, offset))
+
+    async def _fetch_ahead(self, limit: int, offset: int, /) -> _FetchedPage[_PageT]:
+        with defer_warnings() as deferred:
+            page = await self._call(
+                *self._args, **self._kwargs, limit=limit, offset=offset
+            )
+        return page, deferred
+
+    def _discard_pending(self) -> None:
+        while self._pending:
+            task = self._pending.pop()
+            # A fetch that already failed must have its exception retrieved,
+            # otherwise asyncio reports it as never retrieved
+            if not task.cancel() and not task.cancelled():
+                task.exception()
 
 
 @final
@@ -576,22 +786,19 @@ class SyncPageIterator(_BaseSyncPageIterator[_PageT]):
         **kwargs: Any,
     ) -> Iterator[_PageT]:
         cls._validate_unix_pagination_parameter(cfg, method, kwargs)
-        kwargs["max_items"] = max_items
+        iterator = cls(method, *args, max_items=max_items, **kwargs)
+        total_max_items = iterator.max_items
 
         current_timestamp = None
         total_yielded = 0
 
         while True:
-            iterator = cls._create_unix_timestamp_iterator(
-                method, *args, timestamp=current_timestamp, **kwargs
-            )
-
             last_page = None
             for page in iterator:
                 yield page
                 last_page = page
                 total_yielded += iterator._effective_limit
-                if total_yielded >= iterator.max_items:
+                if total_yielded >= total_max_items:
                     return
 
             if last_page is None:
@@ -602,7 +809,9 @@ class SyncPageIterator(_BaseSyncPageIterator[_PageT]):
                 break
             current_timestamp = new_timestamp
 
-            kwargs["max_items"] = iterator.max_items - total_yielded
+            iterator._rewind_unix_window(
+                current_timestamp, total_max_items - total_yielded
+            )
 
     @overload
     @classmethod
@@ -635,7 +844,12 @@ class SyncPageIterator(_BaseSyncPageIterator[_PageT]):
         *,
         deduplicate: bool = True,
     ) -> list[RawAPIItem] | ItemPage[_T]:
-        return cls._process_collected_pages(list(iterator), return_format, deduplicate)
+        collector: _PageCollector[_T] = _PageCollector.for_iterator(
+            iterator, return_format
+        )
+        for page in iterator:
+            collector.add(page)
+        return collector.result(deduplicate=deduplicate)
 
 
 @final
@@ -668,22 +882,19 @@ class AsyncPageIterator(_BaseAsyncPageIterator[_PageT]):
         **kwargs: Any,
     ) -> AsyncIterator[_PageT]:
         cls._validate_unix_pagination_parameter(cfg, method, kwargs)
-        kwargs["max_items"] = max_items
+        iterator = cls(method, *args, max_items=max_items, **kwargs)
+        total_max_items = iterator.max_items
 
         current_timestamp = None
         total_yielded = 0
 
         while True:
-            iterator = cls._create_unix_timestamp_iterator(
-                method, *args, timestamp=current_timestamp, **kwargs
-            )
-
             last_page = None
             async for page in iterator:
                 yield page
                 last_page = page
                 total_yielded += iterator._effective_limit
-                if total_yielded >= iterator.max_items:
+                if total_yielded >= total_max_items:
                     return
 
             if last_page is None:
@@ -694,7 +905,9 @@ class AsyncPageIterator(_BaseAsyncPageIterator[_PageT]):
                 break
             current_timestamp = new_timestamp
 
-            kwargs["max_items"] = iterator.max_items - total_yielded
+            iterator._rewind_unix_window(
+                current_timestamp, total_max_items - total_yielded
+            )
 
     @overload
     @classmethod
@@ -727,6 +940,9 @@ class AsyncPageIterator(_BaseAsyncPageIterator[_PageT]):
         *,
         deduplicate: bool = True,
     ) -> list[RawAPIItem] | ItemPage[_T]:
-        return cls._process_collected_pages(
-            [page async for page in iterator], return_format, deduplicate
+        collector: _PageCollector[_T] = _PageCollector.for_iterator(
+            iterator, return_format
         )
+        async for page in iterator:
+            collector.add(page)
+        return collector.result(deduplicate=deduplicate)
@@ -19,6 +19,17 @@ class DecoupleNotFoundError(FaceitError):
         )
 
 
+@final
+class AiohttpNotFoundError(FaceitError):
+    def __init__(self) -> None:
+        super().__init__(
+            "The `httpx-aiohttp` package is required for the aiohttp transport "
+            "but not installed.\n"
+            "Install it: pip install httpx-aiohttp\n"
+            "Or with faceit[aiohttp]"
+        )
+
+
 @final
 class MissingAuthTokenError(FaceitError):
     def __init__(self, key: str, /) -> None:
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
 import warnings
 from abc import ABC
 from collections import UserString
 from functools import lru_cache
-from threading import Lock
+from threading import Lock, Thread
 from time import time
 from types import MappingProxyType
 from typing import (
@@ -28,7 +29,12 @@ import tenacity.asyncio
 from pydantic import PositiveInt, validate_call
 
 from faceit.constants import BASE_WIKI_URL
-from faceit.exceptions import APIError, DecoupleNotFoundError, MissingAuthTokenError
+from faceit.exceptions import (
+    AiohttpNotFoundError,
+    APIError,
+    DecoupleNotFoundError,
+    MissingAuthTokenError,
+)
 from faceit.utils import (
     create_uuid_validator,
     invoke_callable,
@@ -59,6 +65,17 @@ if TYPE_CHECKING:
 
 _logger = logging.getLogger(__name__)
 
+
+# Response bodies are decoded from their bytes, as `Response.json()` does;
+# the optional `orjson` is picked once here when installed
+try:
+    import orjson  # pyright: ignore[reportMissingImports]
+except ModuleNotFoundError:
+    _json_loads: Callable[[bytes], Any] = json.loads
+else:
+    _json_loads = orjson.loads
+
+
 _HttpxClientT = TypeVar("_HttpxClientT", httpx.Client, httpx.AsyncClient)
 _RetryerT = TypeVar("_RetryerT", tenacity.Retrying, tenacity.AsyncRetrying)
 
@@ -209,7 +226,7 @@ class BaseAPIClient(ABC, Generic[_HttpxClientT, _RetryerT]):
         try:
             response.raise_for_status()
             _logger.debug("Successful response from %s", response.url)
-            return cast("RawAPIResponse", response.json())
+            return cast("RawAPIResponse", _json_loads(response.content))
         except httpx.HTTPStatusError as e:
             if is_retryable_status(e.response.status_code):
                 _logger.warning(
@@ -239,6 +256,7 @@ class _BaseSyncClient(BaseAPIClient[httpx.Client, tenacity.Retrying]):
         base_url: str = BaseAPIClient.DEFAULT_BASE_URL,
         timeout: float = BaseAPIClient.DEFAULT_TIMEOUT,
         retry_args: RetryArgs | None = None,
+        prewarm: bool = False,
         **raw_client_kwargs: Any,
     ) -> None:
         super().__init__(api_key, base_url, retry_args)
@@ -246,6 +264,20 @@ class _BaseSyncClient(BaseAPIClient[httpx.Client, tenacity.Retrying]):
             timeout=timeout, headers=self._base_headers, **raw_client_kwargs
         )
         self._retryer = tenacity.Retrying(**self._retry_args)  # type: ignore[arg-type]
+        if prewarm:
+            Thread(target=self._prewarm, daemon=True).start()
+
+    def _prewarm(self) -> None:
+        # Runs on its own thread, so the client may be closed before it starts;
+        # httpx raises `RuntimeError` if that happens between the check and send
+        if self.is_closed:
+            return
+        try:
+            self._client.head(self.base_url)
+        except (httpx.HTTPError, RuntimeError):
+            _logger.debug(
+                "Connection prewarm to %s failed", self.base_url, exc_info=True
+            )
 
     def close(self) -> None:
         if not self.is_closed:
@@ -273,7 +305,7 @@ class _BaseSyncClient(BaseAPIClient[httpx.Client, tenacity.Retrying]):
 # it was found that such errors often pop up even with a small
 # number of concurrent requests, probably problems on the FACEIT API side.
 class _BaseAsyncClient(BaseAPIClient[httpx.AsyncClient, tenacity.AsyncRetrying]):
-    __slots__ = ("__weakref__", "_client", "_retryer")
+    __slots__ = ("__weakref__", "_client", "_prewarm_task", "_retryer")
 
     _instances: ClassVar[WeakSet[_BaseAsyncClient]] = WeakSet()
 
@@ -313,9 +345,25 @@ class _BaseAsyncClient(BaseAPIClient[httpx.AsyncClient, tenacity.AsyncRetrying])
         ssl_error_threshold: int = DEFAULT_SSL_ERROR_THRESHOLD,
         min_connections: int = DEFAULT_MIN_CONNECTIONS,
         recovery_interval: int = DEFAULT_RECOVERY_INTERVAL,
+        prewarm: bool = False,
+        backend: Literal["httpx", "aiohttp"] = "httpx",
+        http2: bool = False,
         **raw_client_kwargs: Any,
     ) -> None:
         super().__init__(api_key, base_url, retry_args)
+        self._prewarm_task: asyncio.Task[None] | None = None
+        if backend == "aiohttp":
+            if "transport" in raw_client_kwargs:
+                msg = (
+                    "Pass either `backend='aiohttp'` or a custom `transport`, not both."
+                )
+                raise ValueError(msg)
+            raw_client_kwargs["transport"] = self.__class__._create_aiohttp_transport()
+        elif backend != "httpx":
+            msg = (  # type: ignore[unreachable]
+                f"Unsupported backend: {backend!r}. Expected 'httpx' or 'aiohttp'."
+            )
+            raise ValueError(msg)
         max_concurrent_requests = self.__class__._update_initial_max_requests(
             max_concurrent_requests
         )
@@ -334,10 +382,16 @@ class _BaseAsyncClient(BaseAPIClient[httpx.AsyncClient, tenacity.AsyncRetrying])
             max_connections=max_concurrent_requests * 2,
             keepalive_expiry=self.__class__.DEFAULT_KEEPALIVE_EXPIRY,
         )
+        # NOTE: httpx only applies `limits` and `http2` to its own connection pool;
+        # with a custom transport (including the aiohttp backend) they are ignored
+        # and pooling is up to the transport.
+        # HTTP/2 is opt-in (needs `faceit[http2]`): multiplexing changes how many
+        # requests share a connection, which the limits above are sized against
         self._client = httpx.AsyncClient(
             timeout=timeout,
             headers=self._base_headers,
             limits=limits,
+            http2=http2,
             **raw_client_kwargs,
         )
         self._setup_ssl_retry_args()
@@ -355,6 +409,34 @@ class _BaseAsyncClient(BaseAPIClient[httpx.AsyncClient, tenacity.AsyncRetrying])
 
         self.__class__._instances.add(self)
 
+        if prewarm:
+            self._schedule_prewarm()
+
+    def _schedule_prewarm(self) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            _logger.debug("No running event loop, connection prewarm skipped")
+            return
+        # Keep a strong reference: the event loop only holds weak references to tasks
+        self._prewarm_task = loop.create_task(self._prewarm())
+
+    async def _prewarm(self) -> None:
+        try:
+            await self._client.head(self.base_url)
+        except httpx.HTTPError:
+            _logger.debug(
+                "Connection prewarm to %s failed", self.base_url, exc_info=True
+            )
+
+    @staticmethod
+    def _create_aiohttp_transport() -> httpx.AsyncBaseTransport:
+        try:
+            import httpx_aiohttp  # noqa: PLC0415  # pyright: ignore[reportMissingImports]
+        except ModuleNotFoundError:
+            raise AiohttpNotFoundError from None
+        return cast("httpx.AsyncBaseTransport", httpx_aiohttp.AiohttpTransport())
+
     def _setup_ssl_retry_args(self) -> None:
         original_retry = self._retry_args.get("retry", lambda _: False)
 
@@ -391,6 +473,8 @@ class _BaseAsyncClient(BaseAPIClient[httpx.AsyncClient, tenacity.AsyncRetrying])
         }
 
     async def aclose(self) -> None:
+        if self._prewarm_task is not None and not self._prewarm_task.done():
+            self._prewarm_task.cancel()
         if not self.is_closed:
             await self._client.aclose()
             _logger.debug("%s closed", self.__class__.__name__)
@@ -131,7 +131,9 @@ class ItemPage(
 
     @classmethod
     def merge(cls, pages: Iterable[ItemPage[_TT]], /) -> ItemPage[_TT]:
-        return cls._construct_without_metadata(chain.from_iterable(pages))
+        return cls._construct_without_metadata(
+            chain.from_iterable(page.items for page in pages)
+        )
 
     @classmethod
     def with_items(cls, new_items: Iterable[_T], /) -> ItemPage[_T]:
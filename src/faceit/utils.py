@@ -4,7 +4,9 @@ import inspect
 import json
 import reprlib
 import sys
-from contextlib import suppress
+import warnings
+from contextlib import contextmanager, suppress
+from contextvars import ContextVar
 from enum import Enum, auto
 from functools import lru_cache, reduce, wraps
 from hashlib import sha256
@@ -14,7 +16,7 @@ from uuid import UUID
 
 if TYPE_CHECKING:
     from asyncio import Lock as AsyncLock  # noqa: ICN003
-    from collections.abc import Awaitable, Callable, Iterable, Mapping
+    from collections.abc import Awaitable, Callable, Generator, Iterable, Mapping
     from threading import Lock as SyncLock
     from types import FrameType
 
@@ -103,6 +105,13 @@ async def invoke_callable(
     return cast("_T", result)
 
 
+@lru_cache(maxsize=64)
+def _split_key_path(keys: str, /) -> tuple[str, ...]:
+    # Key paths are a handful of constants (e.g. timestamp pagination configs),
+    # so each is split once rather than on every lookup
+    return tuple(keys.split("."))
+
+
 def deep_get(
     dictionary: Mapping[str, Any],
     keys: str,
@@ -111,7 +120,7 @@ def deep_get(
 ) -> _T | Any | None:
     current = dictionary
     try:
-        for key in keys.split("."):
+        for key in _split_key_path(keys):
             current = current[key]
     except (KeyError, TypeError, AttributeError):
         return default
@@ -141,8 +150,32 @@ def get_hashable_representation(obj: Any, /) -> int:
     return int.from_bytes(sha256(obj_str.encode()).digest()[:8], "big", signed=True)
 
 
+def _deduplication_key(obj: Any, /) -> Any:
+    # The key itself is stored rather than a digest of it,
+    # so distinct items can never collide
+    with suppress(TypeError):
+        hash(obj)
+        return obj
+    try:
+        return json.dumps(obj, default=str, sort_keys=True)
+    except (TypeError, AttributeError):
+        return str(obj)
+
+
 def deduplicate_unhashable(values: Iterable[_T], /) -> list[_T]:
-    return list({get_hashable_representation(v): v for v in values}.values())
+    items = list(values)
+    if len(items) <= 1:
+        return items
+    with suppress(TypeError):
+        # Hashable items (e.g. frozen models) dedupe in C without building keys
+        return list(dict.fromkeys(items))
+    seen: set[Any] = set()
+    unique: list[_T] = []
+    for item in items:
+        if (key := _deduplication_key(item)) not in seen:
+            seen.add(key)
+            unique.append(item)
+    return unique
 
 
 _UUID_BYTES: Final = 16
@@ -254,14 +287,47 @@ def find_user_stacklevel() -> int:
     return 1
 
 
+# Set while a page is fetched ahead of its consumer (on a worker thread or task),
+# where no user frame is on the stack for a warning to point at
+_deferred_warnings: Final[ContextVar[list[tuple[str, type[Warning]]] | None]] = (
+    ContextVar("_deferred_warnings", default=None)
+)
+
+
+def warn_user(message: str, category: type[Warning] = UserWarning) -> None:
+    """
+    Emits a library warning pointing at the user's code, or holds it back
+    for the consumer to re-emit when raised inside :func:`defer_warnings`.
+    """
+    if (deferred := _deferred_warnings.get()) is not None:
+        deferred.append((message, category))
+        return
+    warnings.warn(message, category, stacklevel=find_user_stacklevel())
+
+
+@contextmanager
+def defer_warnings() -> Generator[list[tuple[str, type[Warning]]], None, None]:
+    deferred: list[tuple[str, type[Warning]]] = []
+    token = _deferred_warnings.set(deferred)
+    try:
+        yield deferred
+    finally:
+        _deferred_warnings.reset(token)
+
+
 _UNINITIALIZED_MARKER: Final = "uninitialized"
 
 
 def _format_fields(obj: object, fields: tuple[str, ...], *, joiner: str) -> str:
-    return (
-        joiner.join(f"{field}={reprlib.repr(getattr(obj, field))}" for field in fields)
-        if all(hasattr(obj, field) for field in fields)
-        else repr(_UNINITIALIZED_MARKER)
+    # One lookup per field: a missing one (e.g. an unset slot) surfaces as
+    # `AttributeError` instead of being probed with `hasattr` beforehand
+    try:
+        values = [getattr(obj, field) for field in fields]
+    except AttributeError:
+        return repr(_UNINITIALIZED_MARKER)
+    return joiner.join(
+        f"{field}={reprlib.repr(value)}"
+        for field, value in zip(fields, values, strict=True)
     )
 
 
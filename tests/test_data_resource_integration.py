@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
@@ -59,6 +60,7 @@ def test_sync_request_flow(mock_api_key: str) -> None:
             "player_id": "test-id",
             "nickname": "test-user",
         }
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
         mock_instance.request.return_value = mock_response
 
         data = SyncDataResource(mock_api_key)
@@ -84,6 +86,7 @@ async def test_async_request_flow(mock_api_key: str) -> None:
             "player_id": "test-id",
             "nickname": "test-user",
         }
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
         mock_instance.request = AsyncMock(return_value=mock_response)
 
         data = AsyncDataResource(mock_api_key)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import ssl
 from time import time
 from typing import TYPE_CHECKING, Any
@@ -11,7 +12,7 @@ import pytest
 import tenacity
 
 from faceit.constants import BASE_WIKI_URL
-from faceit.exceptions import APIError, BadRequestError
+from faceit.exceptions import AiohttpNotFoundError, APIError, BadRequestError
 from faceit.http import AsyncClient, Endpoint, SyncClient
 from faceit.http.client import (
     BaseAPIClient,
@@ -36,6 +37,7 @@ def _create_response_mock(
     response = Mock()
     response.status_code = status_code
     response.json.return_value = json_data
+    response.content = json.dumps(response.json.return_value).encode()
     response.url = "https://test.com/api"
     response.text = text or str(json_data)
 
@@ -51,6 +53,7 @@ def _create_error_response(status_code: int = 400) -> Mock:
     response = Mock()
     response.status_code = status_code
     response.json.return_value = {"errors": []}
+    response.content = json.dumps(response.json.return_value).encode()
     response.url = "https://test.com/api"
     response.text = httpx.codes.get_reason_phrase(status_code)
     response.is_server_error = status_code >= 500
@@ -180,6 +183,18 @@ class TestBaseAPIClient:
         result = BaseAPIClient._handle_response(mock_response)
         assert result == {"data": "test_data"}
 
+    @pytest.mark.parametrize("decoder", ["json", "orjson"])
+    def test_handle_response_decodes_body(self, decoder: str) -> None:
+        json_loads = pytest.importorskip(decoder).loads
+        response = httpx.Response(
+            200,
+            content=b'{"nickname": "s1mple", "items": [1, 2]}',
+            request=httpx.Request("GET", "https://test.com/api"),
+        )
+        with patch("faceit.http.client._json_loads", json_loads):
+            result = BaseAPIClient._handle_response(response)
+        assert result == {"nickname": "s1mple", "items": [1, 2]}
+
     def test_handle_response_http_error(self, error_response: Mock) -> None:
         with pytest.raises(BadRequestError) as excinfo:
             BaseAPIClient._handle_response(error_response)
@@ -295,6 +310,37 @@ class TestSyncClient:
             client.request("get", "users/123")
         client.close()
 
+    @patch("httpx.Client")
+    def test_prewarm_sends_head_request(
+        self, mock_client: Mock, valid_uuid: str
+    ) -> None:
+        mock_instance = Mock()
+        mock_instance.is_closed = False
+        mock_client.return_value = mock_instance
+
+        with patch("faceit.http.client.Thread") as mock_thread:
+            client = SyncClient(valid_uuid, prewarm=True)
+        mock_thread.return_value.start.assert_called_once()
+        mock_thread.call_args.kwargs["target"]()
+        mock_instance.head.assert_called_once_with(client.base_url)
+        client.close()
+
+    def test_prewarm_after_close_is_skipped(self, valid_uuid: str) -> None:
+        transport = httpx.MockTransport(lambda _: httpx.Response(200))
+        with patch("faceit.http.client.Thread") as mock_thread:
+            client = SyncClient(valid_uuid, prewarm=True, transport=transport)
+        client.close()
+        mock_thread.call_args.kwargs["target"]()
+
+    def test_prewarm_survives_close_during_send(self, valid_uuid: str) -> None:
+        transport = httpx.MockTransport(lambda _: httpx.Response(200))
+        client = SyncClient(valid_uuid, transport=transport)
+        with patch.object(
+            client._client, "head", side_effect=RuntimeError("client has been closed")
+        ):
+            client._prewarm()
+        client.close()
+
 
 class TestAsyncClient:
     async def test_init(self, async_client_factory: Callable[[], AsyncClient]) -> None:
@@ -309,6 +355,64 @@ class TestAsyncClient:
         await client.aclose()
         client._client.aclose.assert_called_once()
 
+    async def test_prewarm_sends_head_request(self, valid_uuid: str) -> None:
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_instance = mock_client.return_value
+            mock_instance.is_closed = False
+            mock_instance.aclose = AsyncMock()
+            mock_instance.head = AsyncMock()
+            client = AsyncClient(valid_uuid, prewarm=True)
+
+        assert client._prewarm_task is not None
+        await client._prewarm_task
+        mock_instance.head.assert_awaited_once_with(client.base_url)
+        await client.aclose()
+
+    def test_prewarm_without_running_loop_is_skipped(self, valid_uuid: str) -> None:
+        with patch("httpx.AsyncClient"):
+            client = AsyncClient(valid_uuid, prewarm=True)
+        assert client._prewarm_task is None
+
+    def test_aiohttp_backend_requires_extra(self, valid_uuid: str) -> None:
+        with (
+            patch.dict("sys.modules", {"httpx_aiohttp": None}),
+            pytest.raises(AiohttpNotFoundError),
+        ):
+            AsyncClient(valid_uuid, backend="aiohttp")
+
+    async def test_custom_transport_is_passed_to_httpx(self, valid_uuid: str) -> None:
+        transport = httpx.MockTransport(lambda _: httpx.Response(200))
+        client = AsyncClient(valid_uuid, transport=transport)
+        assert client._client._transport is transport
+        await client.aclose()
+
+    def test_aiohttp_backend_rejects_custom_transport(self, valid_uuid: str) -> None:
+        with pytest.raises(ValueError, match="not both"):
+            AsyncClient(
+                valid_uuid,
+                backend="aiohttp",
+                transport=httpx.MockTransport(lambda _: httpx.Response(200)),
+            )
+
+    @pytest.mark.parametrize("http2", [True, False])
+    def test_http2_is_opt_in(
+        self,
+        valid_uuid: str,
+        http2: bool,  # noqa: FBT001
+    ) -> None:
+        with patch("httpx.AsyncClient") as mock_httpx:
+            AsyncClient(valid_uuid, http2=http2)
+        assert mock_httpx.call_args.kwargs["http2"] is http2
+
+    def test_http2_is_off_by_default(self, valid_uuid: str) -> None:
+        with patch("httpx.AsyncClient") as mock_httpx:
+            AsyncClient(valid_uuid)
+        assert mock_httpx.call_args.kwargs["http2"] is False
+
+    def test_unknown_backend_raises(self, valid_uuid: str) -> None:
+        with pytest.raises(ValueError, match="Unsupported backend"):
+            AsyncClient(valid_uuid, backend="curl")  # type: ignore[arg-type]
+
     @patch.object(_BaseAsyncClient, "request")
     @pytest.mark.parametrize(
         ("client_method", "endpoint", "call_kwargs", "expected_supported_method"),
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import threading
+import time
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 from unittest.mock import patch
 
 import pytest
-from pydantic import Field
+from pydantic import Field, validate_call
 
 from faceit.api.base import BaseResource
 from faceit.api.pagination import (
@@ -13,6 +15,10 @@ from faceit.api.pagination import (
     BasePageIterator,
     SyncPageIterator,
     TimestampPaginationConfig,
+    _last_page_limit,
+    _page_size,
+    _param_names,
+    _resolve_pagination_limits,
     check_pagination_support,
     pages,
 )
@@ -22,6 +28,7 @@ from faceit.models.custom_types import TimestampMs
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator
 
+    from faceit.api.pagination import MaxItemsType
     from faceit.types import RawAPIPageResponse
 
 
@@ -153,6 +160,77 @@ def test_check_pagination_support_for_resource_method(
     assert pagination_limits.offset is None
 
 
+def test_check_pagination_support_is_cached_per_function(
+    raw_items: list[dict[str, Any]],
+) -> None:
+    first = check_pagination_support(_DummyResource(raw_items).raw_method)
+    assert _DummyResource.raw_method.__pagination_limits__ == first  # type: ignore[attr-defined]
+    with patch(
+        "faceit.api.pagination._resolve_pagination_limits",
+        wraps=_resolve_pagination_limits,
+    ) as resolve:
+        second = check_pagination_support(_DummyResource(raw_items).raw_method)
+    assert first == second
+    resolve.assert_not_called()
+
+
+def test_resource_methods_store_pagination_limits_at_class_creation() -> None:
+    class _Resource(_DummyResource):
+        __slots__ = ()
+
+        def paged(
+            self,
+            *,
+            offset: int = Field(0, ge=0, le=10),
+            limit: int = Field(5, ge=1, le=5),
+        ) -> RawAPIPageResponse:
+            return self.raw_method(offset=offset, limit=limit)
+
+        def broken(self, *, offset: int = 0, limit: int = 5) -> RawAPIPageResponse:
+            return self.raw_method(offset=offset, limit=limit)
+
+    assert vars(_Resource.paged)["__pagination_limits__"] == (5, 10)
+    # Invalid definitions still fail when an iterator is built over them
+    assert "__pagination_limits__" not in vars(_Resource.broken)
+    with pytest.raises(TypeError):
+        SyncPageIterator(_Resource([]).broken)
+
+
+@pytest.mark.parametrize(
+    ("offset", "remainder", "limit", "expected"),
+    [(0, 3, 10, 3), (4, 1, 2, 1), (6, 4, 10, 6), (7, 3, 5, 3)],
+)
+def test_last_page_limit_divides_offset(
+    offset: int, remainder: int, limit: int, expected: int
+) -> None:
+    assert _last_page_limit(offset, remainder, limit) == expected
+
+
+@pytest.mark.parametrize(
+    ("page", "expected"),
+    [
+        (None, None),
+        ({}, None),
+        ({"items": [], "start": 0, "end": 0}, 0),
+        ({"items": [{"id": 1}], "start": 0, "end": 1}, 1),
+        (ItemPage.with_items([]), None),
+        (ItemPage.with_items([1, 2]), 2),
+    ],
+)
+def test_page_size_marks_terminal_pages(page: Any, expected: int | None) -> None:
+    assert _page_size(page) == expected
+
+
+def test_param_names_see_through_validate_call() -> None:
+    @validate_call
+    def method(
+        team_id: str, /, game: str, *, offset: int = 0, limit: int = 2
+    ) -> tuple[str, str, int, int]:
+        return team_id, game, offset, limit
+
+    assert _param_names(method) == {"team_id", "game", "offset", "limit"}
+
+
 def test_extract_unix_timestamp_from_raw_page() -> None:
     second_item_timestamp = 200
     page: RawAPIPageResponse = {
@@ -195,6 +273,15 @@ def test_sync_gather_from_iterator_raw_deduplicates(
     assert result == [{"id": "a"}, {"id": "b"}, {"id": "c"}]
 
 
+def test_sync_gather_from_iterator_raw_format_flattens_pages(
+    raw_pages: tuple[RawAPIPageResponse, RawAPIPageResponse],
+) -> None:
+    result = SyncPageIterator.gather_from_iterator(
+        iter(raw_pages), "raw", deduplicate=False
+    )
+    assert result == [{"id": "a"}, {"id": "b"}, {"id": "b"}, {"id": "c"}]
+
+
 def test_sync_gather_from_iterator_model_merges_pages(
     model_pages: tuple[ItemPage[dict[str, int]], ItemPage[dict[str, int]]],
 ) -> None:
@@ -206,12 +293,71 @@ def test_sync_gather_from_iterator_model_merges_pages(
     assert result.metadata is None
 
 
+def test_sync_gather_from_iterator_deduplicates_hashable_items() -> None:
+    first, second, third = _ModelItem(1, 300), _ModelItem(2, 200), _ModelItem(3, 100)
+    pages_ = (
+        ItemPage[_ModelItem].model_construct(items=(first, second)),
+        ItemPage[_ModelItem].model_construct(items=(_ModelItem(2, 200), third)),
+    )
+    result = SyncPageIterator.gather_from_iterator(
+        iter(pages_), "model", deduplicate=True
+    )
+    assert tuple(result) == (first, second, third)
+
+
+def test_sync_gather_from_iterator_keeps_first_unhashable_duplicate() -> None:
+    first = {"id": 1, "name": "a"}
+    pages_ = [
+        {"items": [first, {"id": 2}]},
+        {"items": [{"name": "a", "id": 1}, {"id": 3}]},
+    ]
+    result = SyncPageIterator.gather_from_iterator(iter(pages_), deduplicate=True)
+    assert result == [first, {"id": 2}, {"id": 3}]
+    assert result[0] is first
+
+
+def test_item_page_merge_concatenates_items(
+    model_pages: tuple[ItemPage[dict[str, int]], ItemPage[dict[str, int]]],
+) -> None:
+    merged = ItemPage.merge(model_pages)
+    assert merged.items == (*model_pages[0].items, *model_pages[1].items)
+    assert merged.metadata is None
+
+
 def test_sync_iterator_collects_using_bound_resource_method() -> None:
     resource = _DummyResource([{"id": 1}, {"id": 2}, {"id": 3}])
     iterator = SyncPageIterator(resource.raw_method, max_items=3)
     assert iterator.collect() == [{"id": 1}, {"id": 2}, {"id": 3}]
 
 
+class _ModelResource(_DummyResource):
+    __slots__ = ()
+
+    def model_method(
+        self,
+        *,
+        offset: int = Field(0, ge=0),
+        limit: int = Field(2, ge=1, le=2),
+    ) -> ItemPage[Any]:
+        return ItemPage.with_items(self._items[offset : offset + limit])
+
+
+def test_sync_iterator_empty_model_collect_returns_item_page() -> None:
+    # An empty model page ends iteration before anything is yielded
+    iterator = SyncPageIterator(_ModelResource([]).model_method, max_items=4)
+    result = iterator.collect()
+    assert isinstance(result, ItemPage)
+    assert result.items == ()
+
+
+def test_iterator_repr_omits_call_arguments(dummy_resource: _DummyResource) -> None:
+    iterator = SyncPageIterator(dummy_resource.raw_method, "x" * 1000, max_items=2)
+    assert repr(iterator) == (
+        "SyncPageIterator(_offset=0, _page_index=0, _max_pages=1, "
+        "_max_items=2, _exhausted=False)"
+    )
+
+
 def test_sync_iterator_strips_user_pagination_params_with_warning(
     dummy_resource: _DummyResource,
 ) -> None:
@@ -245,6 +391,70 @@ def test_sync_unix_iterator_yields_pages(dummy_resource: _DummyResource) -> None
     assert all("items" in page for page in pages_result)
 
 
+def test_sync_unix_iterator_drops_all_user_time_range_params(
+    dummy_resource: _DummyResource,
+) -> None:
+    with pytest.warns(UserWarning, match="managed automatically"):
+        pages_result = list(
+            SyncPageIterator.unix(
+                dummy_resource.raw_method_with_unix,
+                max_items=pages(2),
+                cfg=TimestampPaginationConfig(key="finished_at", attr="finished_at"),
+                start=1,
+                to=150,
+            )
+        )
+    # `to=150` would have hidden the first two items
+    assert pages_result[0]["items"][0]["id"] == "a"
+
+
+class _CappedOffsetResource(_DummyResource):
+    __slots__ = ()
+
+    def raw_method_with_unix(
+        self,
+        *,
+        offset: int = Field(0, ge=0, le=2),
+        limit: int = Field(2, ge=1, le=2),
+        start: int | None = None,
+        to: int | None = None,
+    ) -> RawAPIPageResponse:
+        return super().raw_method_with_unix(
+            offset=offset, limit=limit, start=start, to=to
+        )
+
+
+def test_sync_unix_iterator_spans_windows_up_to_max_items() -> None:
+    resource = _CappedOffsetResource([
+        {"id": i, "finished_at": 1000 - i * 10} for i in range(10)
+    ])
+    pages_result = list(
+        SyncPageIterator.unix(
+            resource.raw_method_with_unix,
+            max_items=pages(5),
+            cfg=TimestampPaginationConfig(key="finished_at", attr="finished_at"),
+        )
+    )
+    assert [[item["id"] for item in page["items"]] for page in pages_result] == [
+        [0, 1],
+        [2, 3],
+        [3, 4],
+        [5, 6],
+        [6, 7],
+    ]
+
+
+@pytest.mark.parametrize(
+    ("max_items", "expected"), [("safe", 6), (pages(2), 4), (3, 3)]
+)
+def test_sync_iterator_max_items_counts_items(
+    dummy_resource: _DummyResource, max_items: MaxItemsType, expected: int
+) -> None:
+    with patch.object(SyncPageIterator, "SAFE_MAX_PAGES", 3):
+        iterator = SyncPageIterator(dummy_resource.raw_method, max_items=max_items)
+    assert iterator.max_items == expected
+
+
 def test_sync_iterator_collect_respects_safe_max_items(
     dummy_resource: _DummyResource,
 ) -> None:
@@ -254,6 +464,68 @@ def test_sync_iterator_collect_respects_safe_max_items(
     assert len(result) == 2
 
 
+@pytest.mark.parametrize("max_items", [1, 3, 5, 6, 9])
+def test_sync_iterator_prefetch_matches_sequential(max_items: int) -> None:
+    resource = _DummyResource([{"id": i} for i in range(7)])
+    sequential = SyncPageIterator(resource.raw_method, max_items=max_items)
+    prefetched = SyncPageIterator(resource.raw_method, max_items=max_items, prefetch=3)
+    assert list(prefetched) == list(sequential)
+
+
+def test_sync_iterator_prefetch_releases_threads_when_exhausted() -> None:
+    resource = _DummyResource([{"id": i} for i in range(7)])
+    iterator = SyncPageIterator(resource.raw_method, max_items=pages(4), prefetch=3)
+    assert len(iterator.collect()) == 7
+    assert iterator._executor is None
+
+
+def test_sync_iterator_close_cancels_prefetched_pages() -> None:
+    resource = _DummyResource([{"id": i} for i in range(10)])
+    iterator = SyncPageIterator(resource.raw_method, max_items=pages(5), prefetch=3)
+    next(iterator)
+    next(iterator)
+    iterator.close()
+    assert not iterator._pending
+    assert iterator._executor is None
+    assert list(iterator) == []
+
+
+class _BlockingResource(_DummyResource):
+    __slots__ = ("release",)
+
+    def __init__(self, items: list[dict[str, Any]]) -> None:
+        super().__init__(items)
+        self.release = threading.Event()
+
+    def raw_method(
+        self,
+        *,
+        offset: int = Field(0, ge=0),
+        limit: int = Field(2, ge=1, le=2),
+    ) -> RawAPIPageResponse:
+        if offset:
+            self.release.wait(5)
+        return super().raw_method(offset=offset, limit=limit)
+
+
+def test_sync_iterator_close_does_not_wait_for_in_flight_pages() -> None:
+    resource = _BlockingResource([{"id": i} for i in range(10)])
+    iterator = SyncPageIterator(resource.raw_method, max_items=pages(5), prefetch=3)
+    next(iterator)
+    iterator._fill_window()
+    started = time.monotonic()
+    iterator.close()
+    assert time.monotonic() - started < 1
+    resource.release.set()
+
+
+def test_sync_iterator_prefetch_rejects_non_positive(
+    dummy_resource: _DummyResource,
+) -> None:
+    with pytest.raises(ValueError):
+        SyncPageIterator(dummy_resource.raw_method, prefetch=0)
+
+
 async def test_async_gather_from_iterator_raw() -> None:
     async def source() -> AsyncIterator[RawAPIPageResponse]:  # noqa: RUF029
         yield {"items": [{"id": 1}], "start": 0, "end": 1}
@@ -283,3 +555,84 @@ async def test_async_unix_iterator_with_invalid_config_raises(
                 dummy_resource.async_raw_method, cfg={"attr": "finished_at"}
             )
         )
+
+
+@pytest.mark.parametrize("max_items", [1, 3, 5, 6, 9])
+async def test_async_iterator_prefetch_matches_sequential(max_items: int) -> None:
+    resource = _DummyResource([{"id": i} for i in range(7)])
+    sequential = AsyncPageIterator(resource.async_raw_method, max_items=max_items)
+    prefetched = AsyncPageIterator(
+        resource.async_raw_method, max_items=max_items, prefetch=3
+    )
+    assert [page async for page in prefetched] == [page async for page in sequential]
+
+
+async def test_async_iterator_prefetch_reset_discards_pending(
+    dummy_resource: _DummyResource,
+) -> None:
+    iterator = AsyncPageIterator(
+        dummy_resource.async_raw_method, max_items=pages(2), prefetch=2
+    )
+    first = await anext(iterator)
+    iterator.reset()
+    assert await anext(iterator) == first
+
+
+async def test_async_iterator_aclose_cancels_prefetched_pages() -> None:
+    resource = _DummyResource([{"id": i} for i in range(10)])
+    iterator = AsyncPageIterator(
+        resource.async_raw_method, max_items=pages(5), prefetch=3
+    )
+    await anext(iterator)
+    await anext(iterator)
+    await iterator.aclose()
+    assert not iterator._pending
+    assert [page async for page in iterator] == []
+
+
+async def test_async_iterator_prefetch_probes_first_page() -> None:
+    resource = _DummyResource([{"id": 1}])
+    offsets: list[int] = []
+
+    async def method(
+        *,
+        offset: int = Field(0, ge=0),
+        limit: int = Field(2, ge=1, le=2),
+    ) -> RawAPIPageResponse:
+        offsets.append(offset)
+        return await resource.async_raw_method(offset=offset, limit=limit)
+
+    with patch(
+        "faceit.api.pagination.check_pagination_support",
+        return_value=check_pagination_support(resource.async_raw_method),
+    ):
+        iterator = AsyncPageIterator(method, max_items=pages(5), prefetch=4)
+    assert [page async for page in iterator] == [
+        {"items": [{"id": 1}], "start": 0, "end": 2}
+    ]
+    assert offsets == [0]
+
+
+async def test_async_iterator_prefetch_failure_discards_pending() -> None:
+    resource = _DummyResource([{"id": i} for i in range(10)])
+
+    async def method(
+        *,
+        offset: int = Field(0, ge=0),
+        limit: int = Field(2, ge=1, le=2),
+    ) -> RawAPIPageResponse:
+        if offset == 2:
+            msg = "boom"
+            raise RuntimeError(msg)
+        return await resource.async_raw_method(offset=offset, limit=limit)
+
+    with patch(
+        "faceit.api.pagination.check_pagination_support",
+        return_value=check_pagination_support(resource.async_raw_method),
+    ):
+        iterator = AsyncPageIterator(method, max_items=pages(5), prefetch=3)
+    await anext(iterator)
+    with pytest.raises(RuntimeError, match="boom"):
+        await anext(iterator)
+    assert not iterator._pending
+    assert not iterator.exhausted
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
@@ -27,10 +28,12 @@ def test_sync_pagination_all_items(mock_api_key: str) -> None:
         mock_response1 = Mock()
         mock_response1.status_code = 200
         mock_response1.json.return_value = page1
+        mock_response1.content = json.dumps(mock_response1.json.return_value).encode()
 
         mock_response2 = Mock()
         mock_response2.status_code = 200
         mock_response2.json.return_value = page2
+        mock_response2.content = json.dumps(mock_response2.json.return_value).encode()
 
         mock_instance.request.side_effect = [mock_response1, mock_response2]
 
@@ -59,10 +62,12 @@ async def test_async_pagination_all_items(mock_api_key: str) -> None:
         mock_response1 = Mock()
         mock_response1.status_code = 200
         mock_response1.json.return_value = page1
+        mock_response1.content = json.dumps(mock_response1.json.return_value).encode()
 
         mock_response2 = Mock()
         mock_response2.status_code = 200
         mock_response2.json.return_value = page2
+        mock_response2.content = json.dumps(mock_response2.json.return_value).encode()
 
         mock_instance.request = AsyncMock(side_effect=[mock_response1, mock_response2])
 
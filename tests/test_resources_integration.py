@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import json
 from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
+from pydantic import ValidationError
 
 from faceit.api import AsyncDataResource, SyncDataResource
+from faceit.api.pagination import check_pagination_support
 
 if TYPE_CHECKING:
     from collections.abc import AsyncGenerator, Generator
@@ -20,6 +23,7 @@ def mock_sync_data(valid_uuid: str) -> Generator[SyncDataResource, None, None]:
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"data": "mocked"}
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
         mock_instance.request.return_value = mock_response
 
         yield SyncDataResource(valid_uuid)
@@ -36,6 +40,7 @@ def mock_async_data(valid_uuid: str) -> AsyncGenerator[AsyncDataResource, None]:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.json.return_value = {"data": "mocked"}
+            mock_response.content = json.dumps(mock_response.json.return_value).encode()
             mock_instance.request = AsyncMock(return_value=mock_response)
 
             yield AsyncDataResource(valid_uuid)  # noqa: ASYNC119
@@ -80,6 +85,65 @@ def test_teams_get(mock_sync_data: SyncDataResource, valid_uuid: str) -> None:
     assert str(args[1]).endswith(f"/teams/{team_id}")
 
 
+def test_teams_without_model_warns_and_returns_payload(
+    mock_sync_data: SyncDataResource, valid_uuid: str
+) -> None:
+    with pytest.warns(UserWarning, match="No model defined"):
+        assert mock_sync_data.teams.get(valid_uuid) == {"data": "mocked"}
+
+
+def test_teams_tournaments_params(
+    mock_sync_data: SyncDataResource, valid_uuid: str
+) -> None:
+    mock_sync_data.raw_teams.tournaments(valid_uuid)
+    args, kwargs = mock_sync_data.client._client.request.call_args
+    assert str(args[1]).endswith(f"/teams/{valid_uuid}/tournaments")
+    assert kwargs["params"] == {"offset": 0, "limit": 20}
+
+    with pytest.raises(ValidationError):
+        mock_sync_data.raw_teams.tournaments(valid_uuid, limit=101)
+    with pytest.raises(ValidationError):
+        mock_sync_data.raw_teams.tournaments(valid_uuid, offset=-1)
+    with pytest.raises(ValidationError):
+        mock_sync_data.raw_teams.tournaments(123)  # type: ignore[arg-type]
+
+
+def test_teams_all_tournaments_warns_on_calling_thread(
+    mock_sync_data: SyncDataResource, valid_uuid: str
+) -> None:
+    page = {"items": [{"id": 1}], "start": 0, "end": 1}
+    mock_response = mock_sync_data.client._client.request.return_value
+    mock_response.json.return_value = page
+    mock_response.content = json.dumps(page).encode()
+
+    with pytest.warns(UserWarning, match="No model defined") as record:
+        result = mock_sync_data.teams.all_tournaments(valid_uuid, prefetch=2)
+    assert result == [{"id": 1}]
+    assert [warning.filename for warning in record] == [__file__]
+
+
+async def test_async_teams_all_tournaments_warns_in_consumer(
+    mock_async_data: AsyncGenerator[AsyncDataResource, None], valid_uuid: str
+) -> None:
+    page = {"items": [{"id": 1}], "start": 0, "end": 1}
+    async for data in mock_async_data:
+        mock_response = data.client._client.request.return_value
+        mock_response.json.return_value = page
+        mock_response.content = json.dumps(page).encode()
+
+        with pytest.warns(UserWarning, match="No model defined") as record:
+            result = await data.teams.all_tournaments(valid_uuid, prefetch=2)
+        assert result == [{"id": 1}]
+        assert [warning.filename for warning in record] == [__file__]
+        await data.client.aclose()
+
+
+def test_teams_tournaments_declares_pagination_limits(
+    mock_sync_data: SyncDataResource,
+) -> None:
+    assert check_pagination_support(mock_sync_data.raw_teams.tournaments) == (100, None)
+
+
 async def test_async_games_items(
     mock_async_data: AsyncGenerator[AsyncDataResource, None],
 ) -> None: